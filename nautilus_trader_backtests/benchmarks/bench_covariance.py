@@ -0,0 +1,48 @@
+import time
+import warnings
+
+import numpy as np
+
+from bt_engine_classes.misc_util.covariance import WEIGHTINGS, RollingCovariance
+
+# run from nautilus_trader_backtests: python -m benchmarks.bench_covariance
+N_ASSETS    =   500
+WINDOW      =   1000                # > N_ASSETS, a shorter window gives a singular covariance
+STEPS       =   200
+
+
+def per_step_ms(fn, steps: int) -> float:
+    start = time.perf_counter()
+    for t in range(steps):
+        fn(t)
+    return (time.perf_counter() - start) / steps * 1e3
+
+
+if __name__ == "__main__":
+
+    rng = np.random.default_rng(0)
+    loadings = rng.normal(0, 0.01, (N_ASSETS, 10))
+    returns = rng.normal(0, 1, (WINDOW + STEPS, 10)) @ loadings.T + rng.normal(0, 0.01, (WINDOW + STEPS, N_ASSETS))
+
+    rolling = RollingCovariance(N_ASSETS, window=WINDOW)
+    ewma = RollingCovariance(N_ASSETS, halflife=WINDOW / 4)
+    for x in returns[:WINDOW]:
+        rolling.update(x)
+        ewma.update(x)
+
+    full = per_step_ms(lambda t: np.cov(returns[t + 1:t + 1 + WINDOW].T), STEPS)
+    incremental = per_step_ms(lambda t: rolling.update(returns[WINDOW + t]), STEPS)
+    ew = per_step_ms(lambda t: ewma.update(returns[WINDOW + t]), STEPS)
+
+    drift = np.abs(rolling.cov - np.cov(returns[-WINDOW:].T)).max()
+    print(f"N={N_ASSETS} window={WINDOW}")
+    print(f"{'full np.cov recompute':<28}{full:>10.3f} ms/timestamp")
+    print(f"{'rolling rank-one update':<28}{incremental:>10.3f} ms/timestamp  (max abs drift {drift:.2e})")
+    print(f"{'ewma rank-one update':<28}{ew:>10.3f} ms/timestamp")
+
+    cov = rolling.cov
+    # a fallback warning means the timing is not the requested weighting, fail instead of reporting it
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for name, weigh in WEIGHTINGS.items():
+            print(f"{name + ' weights':<28}{per_step_ms(lambda t: weigh(cov), 5):>10.3f} ms/rebalance")
@@ -0,0 +1,78 @@
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from benchmarks.synthetic import synthetic_ntdf
+from bt_engine_classes.partitioned_catalog import PartitionedCatalog
+
+# run from nautilus_trader_backtests: python -m benchmarks.bench_partitioned_catalog
+STORE_SIZES =   [(10, 1), (50, 2), (200, 5)] # (instruments, years)
+START       =   "2015-01-01"
+FREQ        =   "1h"
+QUERY_MONTH =   ("2015-06-01", "2015-06-30")
+REPEATS     =   5
+
+
+def build_stores(root: Path, n_instruments: int, years: int) -> tuple[Path, PartitionedCatalog]:
+    flat_path = root / "flat"
+    flat_path.mkdir(parents=True)
+    flat = ParquetDataCatalog(flat_path)
+    partitioned = PartitionedCatalog(root / "partitioned")
+
+    n_ticks = years * 365 * 24
+    start_ns = dt_to_unix_nanos(pd.Timestamp(START, tz="UTC"))
+    for i in range(n_instruments):
+        sim = TestInstrumentProvider.equity(symbol=f"S{i:04d}", venue="SIM")
+        ticks = TradeTickDataWrangler(instrument=sim).process(
+            data=synthetic_ntdf(n_ticks, start=START, freq=FREQ, seed=i), ts_init_delta=0
+        )
+        flat.write_data([sim])
+        flat.write_data(ticks)
+        partitioned.write_ticks(sim, ticks, start_ns, ticks[-1].ts_init)
+    return flat_path, partitioned
+
+
+def best_ms(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+if __name__ == "__main__":
+
+    start = dt_to_unix_nanos(pd.Timestamp(QUERY_MONTH[0], tz="UTC"))
+    end = dt_to_unix_nanos(pd.Timestamp(QUERY_MONTH[1], tz="UTC"))
+    query_id = TestInstrumentProvider.equity(symbol="S0000", venue="SIM").id
+
+    print(f"{'instruments':>12}{'years':>7}{'partitions':>12}{'flat ms':>10}{'partitioned ms':>16}{'pruned to':>11}")
+    for n_instruments, years in STORE_SIZES:
+        root = Path(tempfile.mkdtemp())
+        try:
+            flat_path, partitioned = build_stores(root, n_instruments, years)
+
+            def query_flat():
+                return ParquetDataCatalog(flat_path).trade_ticks(instrument_ids=[str(query_id)], start=start, end=end)
+
+            def query_partitioned():
+                # a fresh catalog each time so the manifest read is part of the measured cost
+                return PartitionedCatalog(partitioned.root).trade_ticks(query_id, start, end)
+
+            assert len(query_flat()) == len(query_partitioned())
+            n_partitions = n_instruments * years * 12
+            pruned = len(partitioned.partitions(query_id, start, end))
+            print(
+                f"{n_instruments:>12}{years:>7}{n_partitions:>12}"
+                f"{best_ms(query_flat):>10.2f}{best_ms(query_partitioned):>16.2f}{pruned:>11}"
+            )
+        finally:
+            shutil.rmtree(root)
@@ -0,0 +1,67 @@
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from benchmarks.synthetic import synthetic_ntdf
+from bt_engine_classes.misc_util.storage import STORAGE_PROFILES, catalog_size_bytes, reencode_catalog
+
+# run from nautilus_trader_backtests: python -m benchmarks.bench_storage_profiles
+SYMBOLS     =   ["AAPL", "MSFT", "GOOG", "AMZN"]
+N_TICKS     =   500_000
+REPEATS     =   3
+
+
+def build_catalog(path: Path) -> None:
+    sims = [TestInstrumentProvider.equity(symbol=s, venue="SIM") for s in SYMBOLS]
+    catalog = ParquetDataCatalog(path)
+    catalog.write_data(sims)
+    for i, sim in enumerate(sims):
+        ticks = TradeTickDataWrangler(instrument=sim).process(data=synthetic_ntdf(N_TICKS, seed=i), ts_init_delta=0)
+        catalog.write_data(ticks)
+
+
+def scan_rows_per_sec(path: Path) -> float:
+    files = list((path / "data").rglob("*.parquet"))
+    best = float("inf")
+    rows = 0
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        rows = sum(pq.read_table(f).num_rows for f in files)
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def decode_ticks_per_sec(path: Path) -> float:
+    catalog = ParquetDataCatalog(path)
+    start = time.perf_counter()
+    n = len(catalog.query(TradeTick))
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+
+    root = Path(tempfile.mkdtemp())
+    try:
+        baseline = root / "written"
+        build_catalog(baseline)
+
+        print(f"{'profile':<18}{'size MB':>10}{'scan rows/s':>16}{'decode ticks/s':>18}")
+        rows = [("write_data default", baseline)]
+        for name in STORAGE_PROFILES:
+            target = root / name
+            shutil.copytree(baseline, target)
+            reencode_catalog(target, name)
+            rows.append((name, target))
+
+        for name, path in rows:
+            size = catalog_size_bytes(path) / 1e6
+            print(f"{name:<18}{size:>10.2f}{scan_rows_per_sec(path):>16,.0f}{decode_ticks_per_sec(path):>18,.0f}")
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,82 @@
+import shutil
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from benchmarks.synthetic import synthetic_ntdf
+from bt_engine_classes.partitioned_catalog import PartitionedCatalog
+from bt_engine_classes.yfinancebt import YFinanceBT
+
+# run from nautilus_trader_backtests: python -m benchmarks.check_precomputed_parity
+# end-to-end check that strategies fed precomputed indicators trade exactly like the tick-by-tick ones
+SYMBOL      =   "AAPL"
+START_DATE  =   "2024-01-01"
+END_DATE    =   "2024-02-01"
+N_TICKS     =   20_000
+VENUE_BAL   =   "1_000_000 USD"
+STRATEGIES  =   [("momentum", "Momentum", 20), ("concavity", "Concavity", 3)] # (module, class, window)
+
+
+def build_catalog(root: Path, layout: str, sim) -> Path:
+    ticks = TradeTickDataWrangler(instrument=sim).process(data=synthetic_ntdf(N_TICKS, start="2024-01-02"), ts_init_delta=0)
+    if layout == "partitioned":
+        start, end = (dt_to_unix_nanos(pd.Timestamp(d, tz="UTC")) for d in (START_DATE, END_DATE))
+        PartitionedCatalog(root).write_ticks(sim, ticks, start, end)
+        return root
+    root.mkdir(parents=True)
+    catalog = ParquetDataCatalog(root)
+    catalog.write_data([sim])
+    catalog.write_data(ticks)
+    return root
+
+
+def run(bt: YFinanceBT, module: str, name: str, window: int, use_precomputed: bool) -> tuple[float, int]:
+    results = bt.run_backtest(strategy_configs=[{
+        "strategy_path": f"strategies.{module}:{name}",
+        "config_path": f"strategies.{module}:{name}Config",
+        "config": {
+            "instrument_id": bt.sims[0].id,
+            "trade_size": Decimal(10_000),
+            "window": window,
+            "use_precomputed": use_precomputed,
+        },
+    }])
+    return float(results[0].stats_pnls["USD"]["PnL (total)"]), results[0].total_orders
+
+
+if __name__ == "__main__":
+
+    sim = TestInstrumentProvider.equity(symbol=SYMBOL, venue="SIM")
+    root = Path(tempfile.mkdtemp())
+    failed = False
+    try:
+        print(f"{'layout':<13}{'prune':<7}{'strategy':<11}{'PnL':>12}{'precomputed PnL':>18}{'orders':>14}")
+        for layout in ("hash", "partitioned"):
+            catalog_path = build_catalog(root / layout, layout, sim)
+            for prune_data in (True, False):
+                bt = YFinanceBT(
+                    [SYMBOL], START_DATE, END_DATE, "1m", root, VENUE_BAL, [sim], [],
+                    prune_data=prune_data, layout=layout,
+                )
+                # the synthetic catalog stands in for the yfinance download
+                bt.ingest = lambda path=catalog_path: path
+                for module, name, window in STRATEGIES:
+                    pnl, orders = run(bt, module, name, window, use_precomputed=False)
+                    pre_pnl, pre_orders = run(bt, module, name, window, use_precomputed=True)
+                    ok = orders > 0 and (pnl, orders) == (pre_pnl, pre_orders)
+                    failed |= not ok
+                    print(
+                        f"{layout:<13}{str(prune_data):<7}{name:<11}{pnl:>12.2f}{pre_pnl:>18.2f}"
+                        f"{f'{orders}/{pre_orders}':>14}{'' if ok else '  MISMATCH'}"
+                    )
+    finally:
+        shutil.rmtree(root)
+
+    if failed:
+        raise SystemExit("precomputed runs do not match the tick-by-tick runs")
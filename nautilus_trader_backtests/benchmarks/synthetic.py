@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+
+def synthetic_ntdf(n_ticks: int, start: str = "2024-01-02", freq: str = "1min", seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a random-walk DataFrame in the same shape yfdf_to_ntdf produces
+
+    Args:
+        n_ticks (int): Number of rows
+        start (str): First timestamp (UTC)
+        freq (str): Spacing between rows
+        seed (int): RNG seed
+
+    Returns:
+        pd.DataFrame: price, quantity and trade_id indexed by a UTC DatetimeIndex
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=n_ticks, freq=freq, tz="UTC")
+    price = np.round(100 * np.exp(np.cumsum(rng.normal(0, 1e-3, n_ticks))), 2)
+    quantity = rng.integers(1, 10_000, n_ticks).astype(float)
+    trade_id = np.arange(n_ticks)
+    return pd.DataFrame({"price": price, "quantity": quantity, "trade_id": trade_id}, index=index)
@@ -0,0 +1,82 @@
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from nautilus_trader.model.identifiers import InstrumentId
+
+from .indicators import IndicatorSpec
+
+
+@dataclass(frozen=True)
+class DataDemand:
+    """
+    The data a strategy consumes, declared before the run so the loader can skip the rest
+
+    Strategies declare it with a `data_demand(cls, config)` classmethod. At runtime a strategy
+    narrows its demand further by unsubscribing once it stops caring (see MultiBuyAndHold),
+    which stops the engine dispatching to it; the declared demand is what is never loaded at all
+
+    Attributes:
+        instrument_ids (tuple[InstrumentId, ...] | None): Instruments consumed, None for every instrument of the run
+        windows (tuple[tuple[str, str], ...] | None): (start, end) date ranges consumed, None for the full run
+        first_and_last (bool): Only the entry tick and the last tick (final mark) of each window are needed,
+            the entry being the first moment every demanded instrument has traded
+        indicators (tuple[IndicatorSpec, ...]): Precomputed indicator streams consumed for each instrument
+    """
+    instrument_ids: tuple[InstrumentId, ...] | None = None
+    windows: tuple[tuple[str, str], ...] | None = None
+    first_and_last: bool = False
+    indicators: tuple[IndicatorSpec, ...] = ()
+
+
+FULL_DEMAND = DataDemand()
+
+
+def resolve_data_demand(strategy_config: dict) -> DataDemand:
+    """
+    Builds the strategy's config from ImportableStrategyConfig kwargs and asks the strategy class for its demand
+
+    Returns:
+        DataDemand: The declared demand, FULL_DEMAND if the strategy does not declare one
+    """
+    module, name = strategy_config["strategy_path"].split(":")
+    strategy_cls = getattr(importlib.import_module(module), name)
+    if not hasattr(strategy_cls, "data_demand"):
+        return FULL_DEMAND
+    module, name = strategy_config["config_path"].split(":")
+    config_cls = getattr(importlib.import_module(module), name)
+    return strategy_cls.data_demand(config_cls(**strategy_config["config"]))
+
+
+def merge_windows(windows: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merges overlapping or touching [start, end] nanosecond ranges
+    """
+    merged = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def tick_bounds(catalog_path: str | Path, instrument_id: InstrumentId, start: int, end: int) -> tuple[int, int] | None:
+    """
+    First and last trade tick ts_init of an instrument inside [start, end], reading only the ts_init column
+
+    Returns:
+        tuple[int, int] | None: (first, last), None if the catalog has no ticks for it in range
+    """
+    tick_dir = Path(catalog_path) / "data" / "trade_tick" / str(instrument_id).replace("/", "")
+    files = sorted(tick_dir.rglob("*.parquet"))
+    if not files:
+        return None
+    ts = pq.ParquetDataset(files).read(columns=["ts_init"]).column("ts_init")
+    ts = ts.filter(pc.and_(pc.greater_equal(ts, start), pc.less_equal(ts, end)))
+    if len(ts) == 0:
+        return None
+    bounds = pc.min_max(ts)
+    return bounds["min"].as_py(), bounds["max"].as_py()
@@ -0,0 +1,201 @@
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.custom import customdataclass
+from nautilus_trader.model.data import CustomData, DataType, TradeTick
+from nautilus_trader.model.identifiers import ClientId, InstrumentId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+PRECOMPUTED_CLIENT_ID = ClientId("PRECOMPUTED")
+# marks a finished store, renamed from ".done" when stores started holding their instrument so older ones are rebuilt
+DONE_MARKER = ".done-with-instrument"
+
+
+@customdataclass
+class IndicatorValue(Data):
+    """
+    One precomputed indicator value, published one nanosecond after the tick it was computed from
+    so it always reaches the strategy after that tick
+    """
+    instrument_id: InstrumentId = InstrumentId.from_str("NONE.SIM")
+    indicator: str = ""
+    params: str = ""
+    value: float = 0.0
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """
+    An indicator and its parameters, e.g. IndicatorSpec.of("change", n=9)
+
+    Attributes:
+        name (str): Key of INDICATORS
+        params (tuple[tuple[str, int], ...]): Sorted (name, value) pairs
+    """
+    name: str
+    params: tuple[tuple[str, int], ...] = ()
+
+    @classmethod
+    def of(cls, name: str, **params: int) -> "IndicatorSpec":
+        if name not in INDICATORS:
+            raise ValueError(f"Unknown indicator '{name}'. Expected one of {sorted(INDICATORS)}")
+        return cls(name, tuple(sorted(params.items())))
+
+    @property
+    def params_key(self) -> str:
+        return ",".join(f"{k}={v}" for k, v in self.params)
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}({self.params_key})"
+
+    def value_of(self, data: Data, instrument_id: InstrumentId) -> float | None:
+        """
+        The value carried by data received in Strategy.on_data, None if it is not this instrument's series
+        """
+        if isinstance(data, CustomData):
+            data = data.data
+        if not isinstance(data, IndicatorValue):
+            return None
+        if data.instrument_id != instrument_id or data.indicator != self.name or data.params != self.params_key:
+            return None
+        return data.value
+
+
+def _lagged(prices: np.ndarray, n: int) -> np.ndarray:
+    out = np.full(len(prices), np.nan)
+    out[n:] = prices[:len(prices) - n]
+    return out
+
+
+def change(prices: np.ndarray, n: int) -> np.ndarray:
+    """
+    prices[t] - prices[t - n]
+    """
+    return prices - _lagged(prices, n)
+
+
+def second_diff(prices: np.ndarray, window: int = 3) -> np.ndarray:
+    """
+    prices[t] - 2 * prices[t - 1] + prices[t - 2], undefined until `window` prices have been seen
+    """
+    out = np.full(len(prices), np.nan)
+    out[2:] = np.diff(prices, n=2)
+    out[:window - 1] = np.nan
+    return out
+
+
+def roc(prices: np.ndarray, n: int) -> np.ndarray:
+    """
+    Rate of change, prices[t] / prices[t - n] - 1
+    """
+    return prices / _lagged(prices, n) - 1
+
+
+def sma(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average over the last `window` prices
+    """
+    out = np.full(len(prices), np.nan)
+    csum = np.cumsum(np.concatenate([[0.0], prices]))
+    out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+INDICATORS = {
+    "change": change,
+    "second_diff": second_diff,
+    "roc": roc,
+    "sma": sma,
+}
+# indicators expressed in price units, rescaled after being computed on integer prices
+PRICE_UNITS = {"change", "second_diff", "sma"}
+
+
+def indicator_store(catalog_path: str | Path, spec: IndicatorSpec, instrument_id: InstrumentId) -> Path:
+    """
+    Catalog holding one (instrument, indicator, params) series, next to the tick data
+    """
+    return Path(catalog_path) / "indicators" / spec.key / str(instrument_id)
+
+
+def is_precomputed(catalog_path: str | Path, spec: IndicatorSpec, instrument_id: InstrumentId) -> bool:
+    return (indicator_store(catalog_path, spec, instrument_id) / DONE_MARKER).exists()
+
+
+def invalidate_indicators(catalog_path: str | Path, instrument_id: InstrumentId) -> None:
+    """
+    Drops every precomputed series of an instrument, called when its ticks change
+    """
+    for store in (Path(catalog_path) / "indicators").glob(f"*/{instrument_id}"):
+        shutil.rmtree(store)
+
+
+def load_indicator(
+        catalog_path: str | Path,
+        spec: IndicatorSpec,
+        instrument_id: InstrumentId,
+        start: int,
+        end: int,
+) -> list[CustomData]:
+    """
+    Stored values of one series in [start, end], wrapped in the DataType the strategies subscribe to
+    """
+    values = ParquetDataCatalog(indicator_store(catalog_path, spec, instrument_id)).query(IndicatorValue, start=start, end=end)
+    data_type = DataType(IndicatorValue)
+    return [CustomData(data_type, v.data if isinstance(v, CustomData) else v) for v in values]
+
+
+def precompute_indicator(
+        catalog_path: str | Path,
+        spec: IndicatorSpec,
+        instrument: Instrument,
+        ticks: list[TradeTick],
+) -> int:
+    """
+    Computes an indicator over a full tick series in one vectorised pass and stores it as IndicatorValue data,
+    together with the instrument, which BacktestNode needs to find in a catalog before loading its data
+
+    Prices are scaled to integers first, so differences are exact and their sign matches
+    what the strategies compute tick by tick on Price objects
+
+    Args:
+        catalog_path (str | Path): Catalog the indicator is stored alongside
+        spec (IndicatorSpec): Indicator and parameters
+        instrument (Instrument): Instrument of the ticks
+        ticks (list[TradeTick]): The instrument's ticks, in time order
+
+    Returns:
+        int: Number of values written (undefined warm-up values are skipped)
+    """
+    scale = 10 ** instrument.price_precision
+    prices = np.round(np.array([t.price.as_double() for t in ticks]) * scale)
+    values = INDICATORS[spec.name](prices, **dict(spec.params))
+    if spec.name in PRICE_UNITS:
+        values = values / scale
+
+    data = [
+        IndicatorValue(
+            instrument_id=instrument.id,
+            indicator=spec.name,
+            params=spec.params_key,
+            value=float(values[i]),
+            ts_event=ticks[i].ts_event,
+            ts_init=ticks[i].ts_init + 1,
+        )
+        for i in np.flatnonzero(~np.isnan(values))
+    ]
+    store = indicator_store(catalog_path, spec, instrument.id)
+    if store.exists():
+        shutil.rmtree(store)
+    store.mkdir(parents=True)
+    catalog = ParquetDataCatalog(store)
+    catalog.write_data([instrument])
+    if data:
+        catalog.write_data(data)
+    (store / DONE_MARKER).touch()
+    return len(data)
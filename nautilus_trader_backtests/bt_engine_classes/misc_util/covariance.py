@@ -0,0 +1,233 @@
+import warnings
+from collections import deque
+
+import numpy as np
+
+
+class RollingCovariance:
+    """
+    Covariance of N return series maintained with O(N^2) rank-one updates per observation
+
+    Rolling mode keeps the running sum and sum of outer products over the last `window`
+    observations, adding the new vector and removing the one that falls out of the window.
+    Exponential mode applies the incremental EW mean / covariance recursion with the given halflife.
+    Neither ever recomputes the matrix from the history
+    """
+    def __init__(self, n_assets: int, window: int | None = None, halflife: float | None = None) -> None:
+        """
+        Args:
+            n_assets (int): Number of series
+            window (int | None): Rolling window length in observations
+            halflife (float | None): EW halflife in observations, used instead of window
+
+        Raises:
+            ValueError: If neither or both of window and halflife are given
+        """
+        if (window is None) == (halflife is None):
+            raise ValueError("Pass exactly one of window or halflife")
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2")
+
+        self.n_assets = n_assets
+        self.window = window
+        self.alpha = None if halflife is None else 1 - 0.5 ** (1 / halflife)
+        self.count = 0
+
+        self._buffer = deque()
+        self._sum = np.zeros(n_assets)
+        self._sum_outer = np.zeros((n_assets, n_assets))
+        self._mean = np.zeros(n_assets)
+        self._cov = np.zeros((n_assets, n_assets))
+
+    def update(self, x: np.ndarray) -> None:
+        """
+        Adds one observation (e.g. the cross-section of returns at a timestamp)
+        """
+        x = np.asarray(x, dtype=float)
+        self.count += 1
+
+        if self.alpha is not None:
+            if self.count == 1:
+                self._mean = x.copy()
+                return
+            diff = x - self._mean
+            self._mean += self.alpha * diff
+            self._cov = (1 - self.alpha) * (self._cov + self.alpha * np.outer(diff, diff))
+            return
+
+        self._buffer.append(x)
+        self._sum += x
+        self._sum_outer += np.outer(x, x)
+        if len(self._buffer) > self.window:
+            old = self._buffer.popleft()
+            self._sum -= old
+            self._sum_outer -= np.outer(old, old)
+
+    @property
+    def mean(self) -> np.ndarray:
+        if self.alpha is not None:
+            return self._mean
+        return self._sum / max(1, len(self._buffer))
+
+    @property
+    def cov(self) -> np.ndarray:
+        """
+        Current covariance matrix (sample covariance in rolling mode)
+        """
+        if self.alpha is not None:
+            return self._cov
+        n = len(self._buffer)
+        if n < 2:
+            return np.zeros((self.n_assets, self.n_assets))
+        return (self._sum_outer - np.outer(self._sum, self._sum) / n) / (n - 1)
+
+
+def inverse_vol_weights(cov: np.ndarray) -> np.ndarray:
+    """
+    Weights proportional to 1 / volatility
+    """
+    inv_vol = 1 / np.sqrt(np.maximum(np.diag(cov), 1e-18))
+    return inv_vol / inv_vol.sum()
+
+
+def _shrink(cov: np.ndarray, ridge: float) -> np.ndarray:
+    n = cov.shape[0]
+    return cov + ridge * max(np.trace(cov) / n, 1e-18) * np.eye(n)
+
+
+def risk_parity_weights(cov: np.ndarray, ridge: float = 1e-6, tol: float = 1e-16, max_iter: int = 50,
+                        rc_tol: float = 1e-3) -> np.ndarray:
+    """
+    Equal risk contribution weights
+
+    Minimises 0.5 x' cov x - sum(log(x_i)) / N with damped Newton steps, whose minimiser has
+    x_i (cov x)_i equal for every asset. Converges in about ten solves even at N=500.
+    With fewer observations than assets the covariance is singular and the objective has no
+    minimum, so the same relative ridge as min_variance_weights is always added, and the
+    result is checked to have equal risk contributions under the original covariance
+
+    Args:
+        cov (np.ndarray): Covariance matrix
+        ridge (float): Shrinkage added to the diagonal, relative to its mean
+        tol (float): Stop once the Newton decrement falls below tol
+        max_iter (int): Upper bound on Newton steps
+        rc_tol (float): Largest accepted relative deviation of a risk contribution from the mean
+
+    Returns:
+        np.ndarray: Long-only weights summing to 1, inverse-volatility weights (with a warning)
+        if no equal risk contribution portfolio is found
+    """
+    n = cov.shape[0]
+    shrunk = _shrink(cov, ridge)
+    budget = 1 / n
+    x = inverse_vol_weights(shrunk)
+    x /= np.sqrt(max(x @ shrunk @ x, 1e-18))
+    for _ in range(max_iter):
+        grad = shrunk @ x - budget / x
+        hess = shrunk + np.diag(budget / x ** 2)
+        step = np.linalg.solve(hess, grad)
+        # relative step sizes stall around 1e-8 on ill-conditioned matrices, the decrement does not
+        if grad @ step < tol:
+            break
+        # halve the step until every weight stays positive
+        scale = 1.0
+        while np.any(x - scale * step <= 0):
+            scale *= 0.5
+        x = x - scale * step
+    else:
+        warnings.warn("risk_parity_weights did not converge, falling back to inverse-volatility weights")
+        return inverse_vol_weights(cov)
+
+    w = x / x.sum()
+    contributions = w * (cov @ w)
+    if contributions.min() <= 0 or np.abs(contributions / contributions.mean() - 1).max() > rc_tol:
+        # a singular covariance (fewer observations than assets) has no equal risk contribution portfolio,
+        # the ridge only makes the solve well posed
+        warnings.warn("risk contributions are not equal, the covariance is likely singular; "
+                      "falling back to inverse-volatility weights")
+        return inverse_vol_weights(cov)
+    return w
+
+
+def _project_simplex(v: np.ndarray) -> np.ndarray:
+    # Euclidean projection onto {w >= 0, sum(w) = 1}
+    u = np.sort(v)[::-1]
+    css = np.cumsum(u) - 1
+    rho = np.flatnonzero(u > css / np.arange(1, len(v) + 1))[-1]
+    return np.maximum(v - css[rho] / (rho + 1), 0)
+
+
+def _support_solution(cov: np.ndarray, support: np.ndarray) -> np.ndarray | None:
+    # min variance restricted to the support, the long-only optimum if every weight stays positive
+    # and no asset outside the support has a smaller marginal variance
+    w = np.zeros(len(cov))
+    w[support] = np.linalg.solve(cov[np.ix_(support, support)], np.ones(support.sum()))
+    if (w[support] <= 0).any():
+        return None
+    w /= w.sum()
+    grad = cov @ w
+    if (grad[~support] < grad[support].mean() * (1 - 1e-9)).any():
+        return None
+    return w
+
+
+def min_variance_weights(cov: np.ndarray, ridge: float = 1e-6, long_only: bool = True,
+                         tol: float = 1e-10, max_iter: int = 5000) -> np.ndarray:
+    """
+    Global minimum variance weights
+
+    Unconstrained, w is proportional to inv(cov) @ 1. Long only, clipping that solution at zero is
+    not the constrained optimum (it can carry far more variance), so w' cov w is minimised over the
+    simplex with accelerated projected gradient, warm started from the clipped solution. Every few
+    steps the support found so far is solved exactly and kept if it satisfies the KKT conditions
+
+    Args:
+        cov (np.ndarray): Covariance matrix
+        ridge (float): Shrinkage added to the diagonal, relative to its mean, keeps the solve stable
+        long_only (bool): No short weights, as a CASH account cannot short
+        tol (float): Long only, stop once no weight moves by more than tol in a step
+        max_iter (int): Long only, upper bound on projected gradient steps
+
+    Returns:
+        np.ndarray: Weights summing to 1
+    """
+    n = cov.shape[0]
+    cov = _shrink(cov, ridge)
+    w = np.linalg.solve(cov, np.ones(n))
+    if not long_only:
+        return w / w.sum()
+    if (w >= 0).all():
+        return w / w.sum()
+
+    # step 1 / L, L the largest eigenvalue of cov (the gradient 2 cov w is scaled by 1/2), from power iteration
+    v = np.ones(n)
+    for _ in range(50):
+        v = cov @ v
+        v /= np.linalg.norm(v)
+    step = 1 / (1.01 * (v @ cov @ v))
+
+    w = np.maximum(w, 0)
+    w = w / w.sum() if w.any() else np.full(n, 1 / n)
+    y, t = w, 1.0
+    for i in range(max_iter):
+        w_next = _project_simplex(y - step * (cov @ y))
+        if np.abs(w_next - w).max() < tol:
+            return w_next
+        if i % 20 == 19 and (exact := _support_solution(cov, w_next > 0)) is not None:
+            return exact
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        # restart the momentum whenever it stops decreasing the variance
+        if (w_next - w) @ (cov @ w_next) > 0:
+            t_next, y = 1.0, w_next
+        else:
+            y = w_next + (t - 1) / t_next * (w_next - w)
+        w, t = w_next, t_next
+    warnings.warn("min_variance_weights did not converge, returning the last iterate")
+    return w
+
+
+WEIGHTINGS = {
+    "inverse_vol": inverse_vol_weights,
+    "risk_parity": risk_parity_weights,
+    "min_variance": min_variance_weights,
+}
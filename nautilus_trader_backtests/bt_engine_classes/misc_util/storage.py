@@ -0,0 +1,179 @@
+import argparse
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+PROFILE_MARKER = ".storage_profile"
+TIMESTAMP_COLUMNS = ("ts_event", "ts_init")
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """
+    Parquet encoding settings applied to every data file of a catalog
+
+    Attributes:
+        name (str): Profile name recorded in the catalog marker file
+        compression (str): Parquet codec ("zstd", "lz4", "snappy", "none", ...)
+        compression_level (int | None): Codec level, None for the codec default
+        row_group_size (int): Maximum number of rows per row group
+        use_dictionary (bool): Dictionary-encode the non-timestamp columns
+        delta_timestamps (bool): DELTA_BINARY_PACKED encoding for ts_event / ts_init
+        sort_by_ts (bool): Sort rows by ts_init before writing
+    """
+    name: str
+    compression: str
+    compression_level: int | None
+    row_group_size: int
+    use_dictionary: bool
+    delta_timestamps: bool
+    sort_by_ts: bool
+
+
+STORAGE_PROFILES = {
+    "balanced": StorageProfile(
+        name="balanced",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=131_072,
+        use_dictionary=True,
+        delta_timestamps=True,
+        sort_by_ts=True,
+    ),
+    "fast-scan": StorageProfile(
+        name="fast-scan",
+        compression="lz4",
+        compression_level=None,
+        row_group_size=1_048_576,
+        use_dictionary=True,
+        delta_timestamps=False,
+        sort_by_ts=True,
+    ),
+    "max-compression": StorageProfile(
+        name="max-compression",
+        compression="zstd",
+        compression_level=19,
+        row_group_size=1_048_576,
+        use_dictionary=True,
+        delta_timestamps=True,
+        sort_by_ts=True,
+    ),
+}
+
+
+def get_storage_profile(profile: str | StorageProfile) -> StorageProfile:
+    """
+    Resolves a profile name to a StorageProfile
+
+    Args:
+        profile (str | StorageProfile): Profile name from STORAGE_PROFILES or a custom profile
+
+    Returns:
+        StorageProfile: The resolved profile
+
+    Raises:
+        ValueError: If the name is not a known profile
+    """
+    if isinstance(profile, StorageProfile):
+        return profile
+    if profile not in STORAGE_PROFILES:
+        raise ValueError(f"Unknown storage profile '{profile}'. Expected one of {sorted(STORAGE_PROFILES)}")
+    return STORAGE_PROFILES[profile]
+
+
+def read_profile_marker(catalog_path: str | Path) -> str | None:
+    """
+    Returns the name of the profile a catalog was last encoded with, or None if never re-encoded
+    """
+    marker = Path(catalog_path) / PROFILE_MARKER
+    if not marker.exists():
+        return None
+    return json.loads(marker.read_text())["name"]
+
+
+def reencode_parquet_file(path: str | Path, profile: StorageProfile) -> None:
+    """
+    Rewrites a single parquet file with the given profile, atomically replacing the original
+
+    Schema metadata written by Nautilus is preserved so the catalog can still decode the file
+    """
+    path = Path(path)
+    table = pq.read_table(path)
+    if profile.sort_by_ts and "ts_init" in table.column_names:
+        table = table.sort_by("ts_init")
+
+    ts_cols = [c for c in TIMESTAMP_COLUMNS if c in table.column_names] if profile.delta_timestamps else []
+    use_dictionary = [c for c in table.column_names if c not in ts_cols] if profile.use_dictionary else False
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(
+        table,
+        tmp_path,
+        compression=profile.compression,
+        compression_level=profile.compression_level,
+        row_group_size=profile.row_group_size,
+        use_dictionary=use_dictionary,
+        column_encoding={c: "DELTA_BINARY_PACKED" for c in ts_cols} or None,
+        write_statistics=True,
+    )
+    os.replace(tmp_path, path)
+
+
+def reencode_catalog(catalog_path: str | Path, profile: str | StorageProfile) -> list[Path]:
+    """
+    Converts every parquet file of an existing ParquetDataCatalog in place
+
+    Args:
+        catalog_path (str | Path): Root of the catalog (the directory containing "data")
+        profile (str | StorageProfile): Target profile
+
+    Returns:
+        list[Path]: The files that were rewritten
+
+    Raises:
+        FileNotFoundError: If the catalog has no data directory
+    """
+    profile = get_storage_profile(profile)
+    catalog_path = Path(catalog_path)
+    data_path = catalog_path / "data"
+    if not data_path.exists():
+        raise FileNotFoundError(f"No catalog data found under {data_path}")
+
+    files = sorted(data_path.rglob("*.parquet"))
+    for file in files:
+        reencode_parquet_file(file, profile)
+
+    (catalog_path / PROFILE_MARKER).write_text(json.dumps(asdict(profile)))
+    return files
+
+
+def catalog_size_bytes(catalog_path: str | Path) -> int:
+    """
+    Returns the total size on disk of the parquet files in a catalog
+    """
+    return sum(f.stat().st_size for f in Path(catalog_path).rglob("*.parquet"))
+
+
+if __name__ == "__main__":
+
+    # python -m bt_engine_classes.misc_util.storage <catalog_path> [<catalog_path> ...] --profile max-compression
+    # a partitioned root (see PartitionedCatalog) is re-encoded partition by partition
+    from ..partitioned_catalog import PartitionedCatalog
+
+    parser = argparse.ArgumentParser(description="Re-encode existing Nautilus catalogs in place")
+    parser.add_argument("catalogs", nargs="+", type=Path)
+    parser.add_argument("--profile", default="balanced", choices=sorted(STORAGE_PROFILES))
+    args = parser.parse_args()
+
+    for catalog in args.catalogs:
+        before = catalog_size_bytes(catalog)
+        partitioned = PartitionedCatalog(catalog)
+        if instrument_ids := partitioned.instrument_ids():
+            rewritten = partitioned.reencode(instrument_ids, args.profile)
+        else:
+            rewritten = reencode_catalog(catalog, args.profile)
+        after = catalog_size_bytes(catalog)
+        print(f"{catalog}: {len(rewritten)} files, {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB ({args.profile})")
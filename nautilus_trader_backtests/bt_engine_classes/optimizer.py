@@ -0,0 +1,319 @@
+import copy
+import hashlib
+import itertools
+import json
+import math
+import random
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+from .yfinancebt import YFinanceBT
+
+
+def total_pnl(results) -> float:
+    """
+    Default objective: total USD PnL of the first run
+    """
+    return float(results[0].stats_pnls["USD"]["PnL (total)"])
+
+
+@dataclass
+class Trial:
+    params: dict[str, Any]
+    budget: float
+    score: float
+    engine_seconds: float
+
+
+def _run_trial(bt: YFinanceBT, strategy_config: dict, start_date: str, end_date: str, objective: Callable) -> tuple[float, float]:
+    start = time.perf_counter()
+    results = bt.run_backtest(strategy_configs=[strategy_config], start_date=start_date, end_date=end_date)
+    score = objective(results)
+    if math.isnan(score):
+        score = -math.inf
+    return score, time.perf_counter() - start
+
+
+class HyperbandOptimizer:
+    """
+    Successive halving / Hyperband over a discrete search space of strategy config values
+
+    Every candidate is first run on a short prefix of the YFinanceBT date range (its budget),
+    only the best 1/eta are promoted to a eta times longer prefix, up to the full range.
+    Brackets draw from one shuffled pass over the grid, so no candidate is sampled twice before
+    every one has been, and when the whole grid fits in a bracket's budget at min_budget
+    the first bracket starts from all of it.
+    Trials run in a process pool, one fresh process per trial so Nautilus logging and
+    global state never leak between runs, and are stored in a sqlite trials database
+    so an interrupted search resumes without re-running finished trials
+    """
+    def __init__(
+            self,
+            bt: YFinanceBT,
+            strategy_config: dict,
+            search_space: dict[str, list],
+            objective: Callable = total_pnl,
+            min_budget: float = 1 / 9,
+            eta: int = 3,
+            sampler: str = "random",
+            max_workers: int | None = None,
+            trials_db: str | Path | None = None,
+            seed: int = 0,
+    ) -> None:
+        """
+        Args:
+            bt (YFinanceBT): Backtest whose symbols, date range and venue are searched over
+            strategy_config (dict): ImportableStrategyConfig kwargs, searched params are merged into its "config"
+            search_space (dict[str, list]): Candidate values per config field, e.g. {"window": [5, 10, 20]}
+            objective (Callable): Maps run_backtest results to a score to maximise, must be picklable
+            min_budget (float): Fraction of the date range used by the first rung, rounded down to a power of 1 / eta
+            eta (int): Promotion ratio between rungs, at least 2
+            sampler (str): "random" or "tpe" (requires optuna)
+            max_workers (int | None): Process pool size
+            trials_db (str | Path | None): sqlite file to resume from, None keeps trials in memory
+            seed (int): Sampler seed
+
+        Raises:
+            ValueError: If the sampler or budgets are invalid
+        """
+        if sampler not in ("random", "tpe"):
+            raise ValueError(f"Unknown sampler '{sampler}'. Expected 'random' or 'tpe'")
+        if not 0 < min_budget <= 1:
+            raise ValueError("min_budget must be in (0, 1]")
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+
+        self.bt = bt
+        self.strategy_config = strategy_config
+        self.search_space = search_space
+        self.objective = objective
+        self.eta = eta
+        # rungs are indexed by integers so the last one is exactly the full range: budget = eta ** -k
+        self.s_max = int(math.floor(math.log(1 / min_budget, eta) + 1e-9))
+        self.min_budget = self._budget(self.s_max)
+        self.sampler = sampler
+        self.max_workers = max_workers
+        self.rng = random.Random(seed)
+        self.seed = seed
+
+        self.trials: list[Trial] = []
+        self._db = sqlite3.connect(str(trials_db) if trials_db else ":memory:")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS trials (key TEXT PRIMARY KEY, params TEXT, budget REAL, score REAL, seconds REAL)"
+        )
+        self._fingerprint = self._study_fingerprint()
+        self._optuna = None
+        self._study = None
+        self._pending = {}
+        self._pool: list[dict] = []
+
+    @property
+    def engine_seconds(self) -> float:
+        """
+        Wall-clock seconds spent inside backtests by this optimizer (resumed trials count as zero)
+        """
+        return sum(t.engine_seconds for t in self.trials)
+
+    def grid(self) -> Trial:
+        """
+        Evaluates every combination on the full date range, the reference the adaptive searches should match
+        """
+        return self._best(self._evaluate(self._all_candidates(), 0))
+
+    def successive_halving(self, n_candidates: int, s: int | None = None) -> Trial:
+        """
+        Runs one successive halving bracket
+
+        Args:
+            n_candidates (int): Candidates in the first rung, capped at the grid size
+            s (int | None): Promotions in the bracket, the first rung runs on eta ** -s of the range.
+                Defaults to s_max, i.e. min_budget
+
+        Returns:
+            Trial: Best trial of the final rung, evaluated on the full range
+        """
+        s = self.s_max if s is None else s
+        candidates = self._sample(n_candidates)
+        for k in range(s, -1, -1):
+            trials = self._evaluate(candidates, k)
+            self._report(trials, k)
+            if k == 0:
+                break
+            trials.sort(key=lambda t: t.score, reverse=True)
+            candidates = [t.params for t in trials[:max(1, len(trials) // self.eta)]]
+
+        self._tell(trials)
+        return self._best(trials)
+
+    def hyperband(self) -> Trial:
+        """
+        Runs every Hyperband bracket, from many candidates on min_budget down to a few on the full range
+
+        Returns:
+            Trial: Best trial evaluated on the full date range
+        """
+        finalists = []
+        grid_size = len(self._all_candidates())
+        for s in range(self.s_max, -1, -1):
+            n = int(math.ceil((self.s_max + 1) / (s + 1) * self.eta ** s))
+            if s == self.s_max and grid_size * self.min_budget <= self.s_max + 1:
+                # a bracket costs about s_max + 1 full-range runs, so covering the grid costs no more than one
+                n = grid_size
+            finalists.append(self.successive_halving(n, s))
+        return self._best(finalists)
+
+    def _all_candidates(self) -> list[dict]:
+        names = list(self.search_space)
+        return [dict(zip(names, values)) for values in itertools.product(*self.search_space.values())]
+
+    def _sample(self, n: int) -> list[dict]:
+        if self.sampler == "tpe":
+            return self._sample_tpe(n)
+        grid = self._all_candidates()
+        if n >= len(grid):
+            return grid
+        candidates = []
+        while len(candidates) < n:
+            if not self._pool:
+                self._pool = self.rng.sample(grid, len(grid))
+            params = self._pool.pop()
+            if params not in candidates:
+                candidates.append(params)
+        return candidates
+
+    def _sample_tpe(self, n: int) -> list[dict]:
+        try:
+            import optuna
+        except ImportError as e:
+            raise ImportError("The 'tpe' sampler requires optuna: pip install optuna") from e
+
+        if self._study is None:
+            self._optuna = optuna
+            optuna.logging.set_verbosity(optuna.logging.WARNING)
+            self._study = optuna.create_study(direction="maximize", sampler=optuna.samplers.TPESampler(seed=self.seed))
+
+        # categorical distributions only accept primitives, so sample indices into the value lists
+        distributions = {
+            name: optuna.distributions.CategoricalDistribution(list(range(len(values))))
+            for name, values in self.search_space.items()
+        }
+        candidates, seen = [], set()
+        grid = self._all_candidates()
+        if n >= len(grid):
+            # the whole grid is evaluated, enqueue it so every candidate is still a trial TPE learns from
+            for params in grid:
+                self._study.enqueue_trial({name: values.index(params[name]) for name, values in self.search_space.items()})
+            n = len(grid)
+        for _ in range(n * 10):
+            if len(candidates) == n:
+                break
+            trial = self._study.ask(distributions)
+            params = {name: self.search_space[name][idx] for name, idx in trial.params.items()}
+            key = self._params_key(params)
+            if key in seen:
+                self._study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+                continue
+            seen.add(key)
+            candidates.append((trial, params))
+
+        self._pending = {self._params_key(params): trial for trial, params in candidates}
+        return [params for _, params in candidates]
+
+    def _report(self, trials: list[Trial], k: int) -> None:
+        # every rung is an intermediate value, so TPE also learns from the candidates eliminated on cheap rungs
+        if self._study is None:
+            return
+        for t in trials:
+            pending = self._pending.get(self._params_key(t.params))
+            if pending is not None:
+                pending.report(t.score, step=self.s_max - k)
+
+    def _tell(self, trials: list[Trial]) -> None:
+        if self._study is None:
+            return
+        for t in trials:
+            pending = self._pending.pop(self._params_key(t.params), None)
+            if pending is not None:
+                self._study.tell(pending, t.score)
+        for pending in self._pending.values():
+            self._study.tell(pending, state=self._optuna.trial.TrialState.PRUNED)
+        self._pending = {}
+
+    def _budget(self, k: int) -> float:
+        return 1.0 if k == 0 else self.eta ** -k
+
+    def _evaluate(self, candidates: list[dict], k: int) -> list[Trial]:
+        budget = self._budget(k)
+        start = pd.Timestamp(self.bt.start_date)
+        end = start + (pd.Timestamp(self.bt.end_date) - start) * budget
+        end_date = end.isoformat()
+
+        done, todo = [], []
+        for params in candidates:
+            row = self._db.execute(
+                "SELECT score, seconds FROM trials WHERE key = ?", (self._key(params, budget),)
+            ).fetchone()
+            if row:
+                done.append(Trial(params, budget, row[0], 0.0))
+            else:
+                todo.append(params)
+
+        if todo:
+            # ingest and precompute once up front so the workers never race on writing the catalog
+            self.bt.precompute_indicators([self._config(params) for params in todo])
+            with ProcessPoolExecutor(max_workers=self.max_workers, max_tasks_per_child=1) as pool:
+                futures = [
+                    pool.submit(_run_trial, self.bt, self._config(params), self.bt.start_date, end_date, self.objective)
+                    for params in todo
+                ]
+                for params, future in zip(todo, futures):
+                    score, seconds = future.result()
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO trials VALUES (?, ?, ?, ?, ?)",
+                        (self._key(params, budget), json.dumps(params, default=str), budget, score, seconds),
+                    )
+                    self._db.commit()
+                    trial = Trial(params, budget, score, seconds)
+                    self.trials.append(trial)
+                    done.append(trial)
+
+        return done
+
+    def _config(self, params: dict) -> dict:
+        cfg = copy.deepcopy(self.strategy_config)
+        cfg["config"] = {**cfg["config"], **params}
+        return cfg
+
+    def _study_fingerprint(self) -> str:
+        # everything besides the searched params that changes a trial's score
+        study = {
+            "symbols": self.bt.symbols,
+            "start_date": self.bt.start_date,
+            "end_date": self.bt.end_date,
+            "interval": self.bt.interval,
+            "venue_bal": self.bt.venue_bal,
+            "strategy_config": self.strategy_config,
+            "objective": f"{self.objective.__module__}.{self.objective.__qualname__}",
+        }
+        return hashlib.sha1(json.dumps(study, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+    def _key(self, params: dict, budget: float) -> str:
+        return f"{self._fingerprint}:{self._params_key(params)}@{budget:.6f}"
+
+    @staticmethod
+    def _params_key(params: dict) -> str:
+        return json.dumps(params, sort_keys=True, default=str)
+
+    @staticmethod
+    def _best(trials: list[Trial]) -> Trial:
+        return max(trials, key=lambda t: t.score)
+
+
+if __name__ == "__main__":
+    print('\033[1;31mDo not run this file directly\033[0m')
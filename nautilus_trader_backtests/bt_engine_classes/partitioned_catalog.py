@@ -0,0 +1,205 @@
+import json
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from .data_demand import merge_windows, tick_bounds
+from .indicators import invalidate_indicators
+from .misc_util.storage import StorageProfile, get_storage_profile, read_profile_marker, reencode_catalog
+
+MANIFEST = "_partitions.json"
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    One instrument-month of trade ticks, stored as its own ParquetDataCatalog
+
+    Attributes:
+        path (str): Partition catalog path, relative to the partitioned root
+        year (int): UTC year of the ticks
+        month (int): UTC month of the ticks
+        min_ts (int): Smallest ts_init in the partition
+        max_ts (int): Largest ts_init in the partition
+        rows (int): Number of ticks
+    """
+    path: str
+    year: int
+    month: int
+    min_ts: int
+    max_ts: int
+    rows: int
+
+
+class PartitionedCatalog:
+    """
+    Trade ticks laid out as <root>/<instrument_id>/<yyyy>/<mm>/, each leaf a ParquetDataCatalog
+
+    Every instrument directory holds a small manifest with the min/max ts_init of its partitions
+    and the date ranges already ingested. Queries read the manifest of the requested instruments only
+    and prune partitions on their stats before any parquet file is opened, so their cost depends on
+    the span queried, not on how many instruments or years the store holds
+    """
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._manifests: dict[str, dict] = {}
+
+    def write_ticks(self, instrument: Instrument, ticks: list[TradeTick], start: int, end: int) -> list[Partition]:
+        """
+        Splits ticks by UTC month and writes each month into its partition, merging with ticks already there
+
+        Args:
+            instrument (Instrument): Instrument of the ticks, stored in every partition
+            ticks (list[TradeTick]): Ticks to write
+            start (int): Start of the ingested range in UNIX nanos, recorded as covered
+            end (int): End of the ingested range in UNIX nanos, recorded as covered
+
+        Returns:
+            list[Partition]: The partitions that were written
+        """
+        manifest = self._manifest(instrument.id)
+        ts = np.array([t.ts_init for t in ticks], dtype="datetime64[ns]")
+        months = ts.astype("datetime64[M]")
+
+        written = []
+        for month in np.unique(months):
+            year, month_num = int(str(month)[:4]), int(str(month)[5:7])
+            rel_path = f"{instrument.id}/{year:04d}/{month_num:02d}"
+            path = self.root / rel_path
+            month_ticks = [ticks[i] for i in np.flatnonzero(months == month)]
+            old_path = path.with_name(path.name + ".old")
+            if old_path.exists() and not path.exists():
+                # an interrupted swap, the moved-aside partition is still the latest complete one
+                old_path.rename(path)
+            if path.exists():
+                existing = ParquetDataCatalog(path).trade_ticks(instrument_ids=[str(instrument.id)])
+                known = {t.ts_init for t in month_ticks}
+                month_ticks = sorted(month_ticks + [t for t in existing if t.ts_init not in known], key=lambda t: t.ts_init)
+
+            # written beside the partition and swapped in, so a failed write never loses the ticks already there
+            tmp_path = path.with_name(path.name + ".tmp")
+            if tmp_path.exists():
+                shutil.rmtree(tmp_path)
+            tmp_path.mkdir(parents=True)
+            catalog = ParquetDataCatalog(tmp_path)
+            catalog.write_data([instrument])
+            catalog.write_data(month_ticks)
+            self._swap(tmp_path, path)
+
+            partition = Partition(
+                path=rel_path,
+                year=year,
+                month=month_num,
+                min_ts=month_ticks[0].ts_init,
+                max_ts=month_ticks[-1].ts_init,
+                rows=len(month_ticks),
+            )
+            manifest["partitions"][rel_path] = asdict(partition)
+            written.append(partition)
+
+        manifest["coverage"] = merge_windows([tuple(w) for w in manifest["coverage"]] + [(start, end)])
+        self._save_manifest(instrument.id, manifest)
+        invalidate_indicators(self.root, instrument.id)
+        return written
+
+    def trade_ticks(self, instrument_id: InstrumentId, start: int | None = None, end: int | None = None) -> list[TradeTick]:
+        """
+        Trade ticks of an instrument in [start, end], read from the pruned partitions only
+        """
+        return [
+            tick
+            for p in self.partitions(instrument_id, start, end)
+            for tick in ParquetDataCatalog(self.root / p.path).trade_ticks(
+                instrument_ids=[str(instrument_id)], start=start, end=end
+            )
+        ]
+
+    def covers(self, instrument_id: InstrumentId, start: int, end: int) -> bool:
+        """
+        Whether [start, end] has already been ingested for the instrument
+        """
+        return any(w_start <= start and end <= w_end for w_start, w_end in self._manifest(instrument_id)["coverage"])
+
+    def partitions(self, instrument_id: InstrumentId, start: int | None = None, end: int | None = None) -> list[Partition]:
+        """
+        Partitions of an instrument overlapping [start, end], pruned on the manifest stats alone
+
+        Returns:
+            list[Partition]: Matching partitions in time order
+        """
+        start = 0 if start is None else start
+        end = np.iinfo(np.int64).max if end is None else end
+        parts = [Partition(**p) for p in self._manifest(instrument_id)["partitions"].values()]
+        return sorted((p for p in parts if p.max_ts >= start and p.min_ts <= end), key=lambda p: p.min_ts)
+
+    def tick_bounds(self, instrument_id: InstrumentId, start: int, end: int) -> tuple[int, int] | None:
+        """
+        First and last tick inside [start, end], answered from the stats unless the range cuts into a partition
+        """
+        parts = self.partitions(instrument_id, start, end)
+        first = next((ts for ts in (self._edge(p, instrument_id, start, end, 0) for p in parts) if ts is not None), None)
+        last = next((ts for ts in (self._edge(p, instrument_id, start, end, 1) for p in reversed(parts)) if ts is not None), None)
+        if first is None:
+            return None
+        return first, last
+
+    def _edge(self, partition: Partition, instrument_id: InstrumentId, start: int, end: int, side: int) -> int | None:
+        # a partition entirely inside the range answers from its stats, one cut by the range reads ts_init
+        if side == 0 and partition.min_ts >= start:
+            return partition.min_ts
+        if side == 1 and partition.max_ts <= end:
+            return partition.max_ts
+        bounds = tick_bounds(self.root / partition.path, instrument_id, start, end)
+        return bounds[side] if bounds else None
+
+    def reencode(self, instrument_ids: list[InstrumentId], profile: str | StorageProfile) -> list[Path]:
+        """
+        Re-encodes the partitions of the given instruments not already stored with the profile
+
+        Returns:
+            list[Path]: The files that were rewritten
+        """
+        profile = get_storage_profile(profile)
+        rewritten = []
+        for instrument_id in instrument_ids:
+            for partition in self.partitions(instrument_id):
+                path = self.root / partition.path
+                if read_profile_marker(path) != profile.name:
+                    rewritten += reencode_catalog(path, profile)
+        return rewritten
+
+    def instrument_ids(self) -> list[InstrumentId]:
+        """
+        Instruments stored under the root, found from their manifests
+        """
+        return [InstrumentId.from_str(path.parent.name) for path in sorted(self.root.glob(f"*/{MANIFEST}"))]
+
+    @staticmethod
+    def _swap(tmp_path: Path, path: Path) -> None:
+        # a directory cannot be replaced in one rename, so the old partition is moved aside first
+        old_path = path.with_name(path.name + ".old")
+        if path.exists():
+            path.rename(old_path)
+        tmp_path.rename(path)
+        if old_path.exists():
+            shutil.rmtree(old_path)
+
+    def _manifest(self, instrument_id: InstrumentId) -> dict:
+        key = str(instrument_id)
+        if key not in self._manifests:
+            path = self.root / key / MANIFEST
+            self._manifests[key] = json.loads(path.read_text()) if path.exists() else {"partitions": {}, "coverage": []}
+        return self._manifests[key]
+
+    def _save_manifest(self, instrument_id: InstrumentId, manifest: dict) -> None:
+        path = self.root / str(instrument_id) / MANIFEST
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(MANIFEST + ".tmp")
+        tmp_path.write_text(json.dumps(manifest))
+        tmp_path.replace(path)
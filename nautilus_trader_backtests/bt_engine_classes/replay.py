@@ -0,0 +1,213 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import ImportableStrategyConfig, LoggingConfig, StrategyFactory
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import InstrumentId, Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+PERCENTILES = (50, 99, 99.9)
+
+
+@dataclass
+class LatencyReport:
+    """
+    Per-strategy result of a paced replay, latencies are in microseconds
+
+    Attributes:
+        strategy (str): Strategy path
+        speed (float | None): Replay speed multiplier, None for max speed
+        events (int): Ticks emitted by the feed
+        dropped (int): Ticks dropped because the backlog was full
+        max_backlog (int): Deepest queue seen by the feed
+        queue_delay_us (np.ndarray): Scheduled arrival -> dequeued by the strategy runner
+        handler_us (np.ndarray): Time spent inside on_trade_tick
+        dispatch_us (np.ndarray): Full engine dispatch of the event, handler included
+    """
+    strategy: str
+    speed: float | None
+    events: int = 0
+    dropped: int = 0
+    max_backlog: int = 0
+    queue_delay_us: np.ndarray = field(default_factory=lambda: np.empty(0))
+    handler_us: np.ndarray = field(default_factory=lambda: np.empty(0))
+    dispatch_us: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def percentiles(self) -> dict[str, tuple[float, ...]]:
+        return {
+            name: tuple(np.percentile(values, PERCENTILES)) if len(values) else (np.nan,) * len(PERCENTILES)
+            for name, values in (
+                ("queue_delay", self.queue_delay_us),
+                ("handler", self.handler_us),
+                ("dispatch", self.dispatch_us),
+            )
+        }
+
+    def __str__(self) -> str:
+        speed = "max" if self.speed is None else f"{self.speed:g}x"
+        lines = [
+            f"{self.strategy} @ {speed}: {self.events} events, {self.dropped} dropped, max backlog {self.max_backlog}",
+            f"    {'(us)':<12}{'p50':>12}{'p99':>12}{'p99.9':>12}",
+        ]
+        for name, (p50, p99, p999) in self.percentiles().items():
+            lines.append(f"    {name:<12}{p50:>12.1f}{p99:>12.1f}{p999:>12.1f}")
+        return "\n".join(lines)
+
+
+class ReplayHarness:
+    """
+    Streams a catalog's trade ticks through a local asyncio feed paced at 1x, Nx or max speed
+    and drives one strategy at a time through a streaming BacktestEngine
+
+    Ticks sharing a timestamp across instruments are released together, so multi-instrument
+    bars arrive as a burst. The feed never waits for the strategy: if the backlog reaches
+    max_backlog the tick is dropped, as a live feed handler would
+    """
+    def __init__(
+            self,
+            catalog_path: str | Path,
+            instrument_ids: list[InstrumentId],
+            venue_bal: str,
+            speed: float | None = 1.0,
+            max_backlog: int = 10_000,
+            start: int | None = None,
+            end: int | None = None,
+            log_level: str = "ERROR",
+    ) -> None:
+        """
+        Args:
+            catalog_path (str | Path): ParquetDataCatalog to replay
+            instrument_ids (list[InstrumentId]): Instruments to stream
+            venue_bal (str): Starting balance of the SIM venue, e.g. "1_000_000 USD"
+            speed (float | None): Replay speed multiplier over data time, None for max speed
+            max_backlog (int): Queue depth after which ticks are dropped
+            start (int | None): Start of the replay in UNIX nanos
+            end (int | None): End of the replay in UNIX nanos
+            log_level (str): Engine log level, kept high so logging does not dominate the handler latency
+
+        Raises:
+            ValueError: If speed is not positive or the catalog has no ticks for the instruments
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive or None for max speed")
+
+        catalog = ParquetDataCatalog(catalog_path)
+        ids = [str(i) for i in instrument_ids]
+        self.instruments = catalog.instruments(instrument_ids=ids)
+        self.ticks: list[TradeTick] = sorted(
+            catalog.trade_ticks(instrument_ids=ids, start=start, end=end),
+            key=lambda t: t.ts_init,
+        )
+        if not self.ticks:
+            raise ValueError(f"No trade ticks in {catalog_path} for {ids}")
+
+        self.venue_bal = venue_bal
+        self.speed = speed
+        self.max_backlog = max_backlog
+        self.log_level = log_level
+
+    def run(self, strategy_configs: list[dict]) -> list[LatencyReport]:
+        """
+        Replays the feed once per strategy config
+
+        Args:
+            strategy_configs (list[dict]): ImportableStrategyConfig kwargs, as passed to YFinanceBT
+
+        Returns:
+            list[LatencyReport]: One report per strategy
+        """
+        return [asyncio.run(self._replay(cfg)) for cfg in strategy_configs]
+
+    def _build_engine(self, cfg: dict) -> tuple[BacktestEngine, list[float]]:
+        engine = BacktestEngine(
+            config=BacktestEngineConfig(trader_id="REPLAY-001", logging=LoggingConfig(log_level=self.log_level))
+        )
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.CASH,
+            base_currency=USD,
+            starting_balances=[Money.from_str(self.venue_bal)],
+        )
+        for instrument in self.instruments:
+            engine.add_instrument(instrument)
+
+        strategy = StrategyFactory.create(ImportableStrategyConfig(**cfg))
+        handler_s = []
+        on_trade_tick = strategy.on_trade_tick
+
+        # the instance attribute shadows the class method, Cython's cpdef dispatch looks it up per call
+        def timed_on_trade_tick(tick: TradeTick) -> None:
+            t0 = time.perf_counter()
+            on_trade_tick(tick)
+            handler_s.append(time.perf_counter() - t0)
+
+        strategy.on_trade_tick = timed_on_trade_tick
+        engine.add_strategy(strategy)
+        return engine, handler_s
+
+    async def _replay(self, cfg: dict) -> LatencyReport:
+        engine, handler_s = self._build_engine(cfg)
+        report = LatencyReport(strategy=cfg["strategy_path"], speed=self.speed)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_backlog)
+        queue_delay_s, dispatch_s = [], []
+        loop = asyncio.get_running_loop()
+
+        def dispatch(tick: TradeTick) -> float:
+            t0 = time.perf_counter()
+            engine.add_data([tick])
+            engine.run(streaming=True)
+            engine.clear_data()
+            return time.perf_counter() - t0
+
+        async def feed() -> None:
+            t0 = time.perf_counter()
+            ts0 = self.ticks[0].ts_init
+            for i, tick in enumerate(self.ticks):
+                if self.speed is None:
+                    scheduled = time.perf_counter()
+                else:
+                    scheduled = t0 + (tick.ts_init - ts0) / 1e9 / self.speed
+                    wait = scheduled - time.perf_counter()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                report.events += 1
+                report.max_backlog = max(report.max_backlog, queue.qsize())
+                try:
+                    queue.put_nowait((scheduled, tick))
+                except asyncio.QueueFull:
+                    report.dropped += 1
+                # yield after each burst of same-timestamp ticks, so the runner can pick up finished dispatches
+                # at max speed and when the feed is behind its schedule and never sleeps
+                if i + 1 == len(self.ticks) or self.ticks[i + 1].ts_init != tick.ts_init:
+                    await asyncio.sleep(0)
+            await queue.put(None)
+
+        async def runner(pool: ThreadPoolExecutor) -> None:
+            while (item := await queue.get()) is not None:
+                scheduled, tick = item
+                queue_delay_s.append(time.perf_counter() - scheduled)
+                dispatch_s.append(await loop.run_in_executor(pool, dispatch, tick))
+
+        # the engine runs on its own thread so the feed keeps its pace while a handler is busy
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            await asyncio.gather(feed(), runner(pool))
+            await loop.run_in_executor(pool, engine.end)
+        engine.dispose()
+
+        report.queue_delay_us = np.asarray(queue_delay_s) * 1e6
+        report.handler_us = np.asarray(handler_s) * 1e6
+        report.dispatch_us = np.asarray(dispatch_s) * 1e6
+        return report
+
+
+if __name__ == "__main__":
+    print('\033[1;31mDo not run this file directly\033[0m')
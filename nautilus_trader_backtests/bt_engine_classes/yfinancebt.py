@@ -1,8 +1,10 @@
 import hashlib
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 import yfinance as yf
+from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.node import (
     BacktestDataConfig,
     BacktestEngineConfig,
@@ -11,13 +13,31 @@ from nautilus_trader.backtest.node import (
     BacktestVenueConfig,
 )
 from nautilus_trader.common.component import init_logging
-from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import ImportableStrategyConfig, StrategyFactory
 from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import InstrumentId, Venue
 from nautilus_trader.model.instruments import Equity
+from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
 from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from .data_demand import merge_windows, resolve_data_demand, tick_bounds
+from .indicators import (
+    PRECOMPUTED_CLIENT_ID,
+    IndicatorSpec,
+    IndicatorValue,
+    indicator_store,
+    is_precomputed,
+    load_indicator,
+    precompute_indicator,
+)
 from .misc_util.convert import yfdf_to_ntdf
+from .misc_util.storage import StorageProfile, get_storage_profile, read_profile_marker, reencode_catalog
+from .partitioned_catalog import PartitionedCatalog
+
+LAYOUTS = ("hash", "partitioned")
 
 
 class YFinanceBT:
@@ -31,8 +51,13 @@ class YFinanceBT:
             data_output_path: str | Path,
             venue_bal: str,
             sims: list[Equity],
-            strategy_configs: list[dict]
+            strategy_configs: list[dict],
+            storage_profile: str | StorageProfile | None = None,
+            prune_data: bool = True,
+            layout: str = "hash",
     ) -> None:
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown catalog layout '{layout}'. Expected one of {LAYOUTS}")
         self.symbols = symbols
         self.start_date = start_date
         self.end_date = end_date
@@ -41,11 +66,27 @@ class YFinanceBT:
         self.venue_bal = venue_bal
         self.strategy_configs = strategy_configs
         self.sims = sims
+        self.storage_profile = get_storage_profile(storage_profile) if storage_profile else None
+        self.prune_data = prune_data
+        self.layout = layout
 
         self.results = None
 
-    def run_backtest(self):
-        _ = init_logging()
+    def ingest(self) -> Path:
+        """
+        Downloads the data into the run's catalog if it is not there yet
+        and re-encodes it when the requested storage profile differs from the one on disk
+
+        The "hash" layout keeps one catalog per run, the "partitioned" layout shares one
+        PartitionedCatalog per interval across runs and only downloads instruments whose
+        date range has not been ingested before
+
+        Returns:
+            Path: The catalog path (the partitioned root for the partitioned layout)
+        """
+        if self.layout == "partitioned":
+            return self._ingest_partitioned()
+
         raw_key = f"{''.join(self.symbols)}{self.start_date}{self.end_date}{self.interval}"
         hash_id = hashlib.sha1(raw_key.encode()).hexdigest()[:12]
         catalog_path = self.data_output_path / hash_id
@@ -58,22 +99,61 @@ class YFinanceBT:
                 ntdf = yfdf_to_ntdf(df)
                 catalog.write_data(TradeTickDataWrangler(instrument=sim).process(data=ntdf, ts_init_delta=0))
 
+        if self.storage_profile and read_profile_marker(catalog_path) != self.storage_profile.name:
+            reencode_catalog(catalog_path, self.storage_profile)
+
+        return catalog_path
+
+    def _ingest_partitioned(self) -> Path:
+        root = self.data_output_path / f"partitioned_{self.interval}"
+        catalog = PartitionedCatalog(root)
+        start, end = _to_nanos(self.start_date), _to_nanos(self.end_date)
+        for sim in self.sims:
+            if catalog.covers(sim.id, start, end):
+                continue
+            df = yf.download(sim.symbol.value, start=self.start_date, end=self.end_date, interval=self.interval)
+            ntdf = yfdf_to_ntdf(df)
+            catalog.write_ticks(sim, TradeTickDataWrangler(instrument=sim).process(data=ntdf, ts_init_delta=0), start, end)
+
+        if self.storage_profile:
+            catalog.reencode([sim.id for sim in self.sims], self.storage_profile)
+
+        return root
+
+    def run_backtest(
+            self,
+            strategy_configs: list[dict] | None = None,
+            start_date: str | None = None,
+            end_date: str | None = None,
+    ):
+        """
+        Runs the strategies over the catalog
+
+        Args:
+            strategy_configs (list[dict] | None): Overrides self.strategy_configs for this run
+            start_date (str | None): Start of a sub-range of the ingested date range
+            end_date (str | None): End of a sub-range of the ingested date range
+
+        Returns:
+            list[BacktestResult]: One result per run config
+        """
+        _init_logging_once()
+        catalog_path = self.ingest()
+        strategy_configs = strategy_configs if strategy_configs is not None else self.strategy_configs
+        start_date = start_date or self.start_date
+        end_date = end_date or self.end_date
+
+        if self.layout == "partitioned":
+            self.results = [self._run_partitioned(catalog_path, strategy_configs, start_date, end_date)]
+            return self.results
+
         self.results = BacktestNode(
             configs=[
                 BacktestRunConfig(
                     engine=BacktestEngineConfig(
-                        strategies=[ImportableStrategyConfig(**cfg) for cfg in self.strategy_configs],
+                        strategies=[ImportableStrategyConfig(**cfg) for cfg in strategy_configs],
                     ),
-                    data=[
-                        BacktestDataConfig(
-                            catalog_path=str(catalog_path),
-                            data_cls=TradeTick,
-                            instrument_id=sim.id,
-                            start_time=dt_to_unix_nanos(pd.Timestamp(self.start_date, tz="America/New_York")),
-                            end_time=dt_to_unix_nanos(pd.Timestamp(self.end_date, tz="America/New_York")),
-                        )
-                        for sim in self.sims
-                    ],
+                    data=self.data_configs(catalog_path, strategy_configs, start_date, end_date),
                     venues=[
                         BacktestVenueConfig(
                             name="SIM",
@@ -89,3 +169,184 @@ class YFinanceBT:
 
         return self.results
 
+    def precompute_indicators(self, strategy_configs: list[dict] | None = None) -> None:
+        """
+        Offline stage computing every indicator the strategies declare in their DataDemand,
+        vectorised over each instrument's full tick history and stored alongside the catalog.
+        Series already stored are skipped, so sweeps and reruns only pay for order logic
+
+        Args:
+            strategy_configs (list[dict] | None): Overrides self.strategy_configs
+        """
+        catalog_path = self.ingest()
+        strategy_configs = strategy_configs if strategy_configs is not None else self.strategy_configs
+        for demand in map(resolve_data_demand, strategy_configs):
+            for inst_id in demand.instrument_ids or [sim.id for sim in self.sims]:
+                for spec in demand.indicators:
+                    self._ensure_indicator(catalog_path, inst_id, spec)
+
+    def _ensure_indicator(self, catalog_path: Path, inst_id: InstrumentId, spec: IndicatorSpec) -> None:
+        if is_precomputed(catalog_path, spec, inst_id):
+            return
+        if self.layout == "partitioned":
+            ticks = PartitionedCatalog(catalog_path).trade_ticks(inst_id)
+        else:
+            ticks = ParquetDataCatalog(catalog_path).trade_ticks(instrument_ids=[str(inst_id)])
+        sim = next(sim for sim in self.sims if sim.id == inst_id)
+        precompute_indicator(catalog_path, spec, sim, ticks)
+
+    def data_configs(
+            self,
+            catalog_path: Path,
+            strategy_configs: list[dict],
+            start_date: str,
+            end_date: str,
+    ) -> list[BacktestDataConfig]:
+        """
+        Builds the BacktestNode data configs of a "hash" layout run from the strategies' demanded spans
+
+        Returns:
+            list[BacktestDataConfig]: One config per instrument and time span to load
+        """
+        spans, indicator_spans = self.demanded_spans(catalog_path, strategy_configs, start_date, end_date)
+        return [
+            BacktestDataConfig(
+                catalog_path=str(catalog_path),
+                data_cls=TradeTick,
+                instrument_id=inst_id,
+                start_time=span_start,
+                end_time=span_end,
+            )
+            for inst_id, inst_spans in spans.items()
+            for span_start, span_end in inst_spans
+        ] + [
+            BacktestDataConfig(
+                catalog_path=str(indicator_store(catalog_path, spec, inst_id)),
+                data_cls=IndicatorValue,
+                instrument_id=inst_id,
+                start_time=span_start,
+                end_time=span_end,
+                client_id=PRECOMPUTED_CLIENT_ID.value,
+            )
+            for (inst_id, spec), ind_spans in indicator_spans.items()
+            for span_start, span_end in ind_spans
+        ]
+
+    def demanded_spans(
+            self,
+            catalog_path: Path,
+            strategy_configs: list[dict],
+            start_date: str,
+            end_date: str,
+    ) -> tuple[dict[InstrumentId, list[tuple[int, int]]], dict[tuple[InstrumentId, IndicatorSpec], list[tuple[int, int]]]]:
+        """
+        Merged nanosecond spans of ticks and indicator values to load, from the union of the strategies' DataDemand
+
+        Instruments no strategy consumes are not loaded, windows are clipped to the run,
+        and first-and-last demands load just the entry tick and the final mark per window. The entry tick of
+        each instrument is its last one at or before the first moment every demanded instrument has traded,
+        so the entry fills at the same prices as in an unpruned run.
+        Declared indicators are precomputed if missing and always loaded, strategies cannot run without them.
+        With prune_data disabled every instrument's ticks are loaded over the full range
+
+        Returns:
+            tuple: Tick spans per instrument and indicator spans per (instrument, indicator)
+        """
+        start, end = _to_nanos(start_date), _to_nanos(end_date)
+        if self.layout == "partitioned":
+            bounds_of = PartitionedCatalog(catalog_path).tick_bounds
+        else:
+            bounds_of = partial(tick_bounds, catalog_path)
+        spans = {sim.id: [] for sim in self.sims}
+        indicator_spans = {}
+        demands = [resolve_data_demand(cfg) for cfg in strategy_configs]
+        if not self.prune_data or not demands:
+            spans = {sim.id: [(start, end)] for sim in self.sims}
+
+        for demand in demands:
+            windows = [(start, end)] if demand.windows is None else [
+                (max(start, _to_nanos(w_start)), min(end, _to_nanos(w_end))) for w_start, w_end in demand.windows
+            ]
+            inst_ids = list(demand.instrument_ids or spans)
+            for inst_id in inst_ids:
+                if inst_id not in spans:
+                    raise ValueError(f"Strategy demands {inst_id} which is not one of the run's sims")
+            for w_start, w_end in windows:
+                if w_start > w_end:
+                    continue
+                for inst_id in inst_ids:
+                    for spec in demand.indicators:
+                        indicator_spans.setdefault((inst_id, spec), []).append((w_start, w_end))
+                if not self.prune_data:
+                    continue
+                if not demand.first_and_last:
+                    for inst_id in inst_ids:
+                        spans[inst_id].append((w_start, w_end))
+                    continue
+                bounds = {inst_id: b for inst_id in inst_ids if (b := bounds_of(inst_id, w_start, w_end))}
+                if not bounds:
+                    continue
+                # the entry happens once every instrument has traded, at the price each one last traded at by then,
+                # not at each instrument's own first tick
+                entry = max(first for first, _ in bounds.values())
+                for inst_id, (_, last) in bounds.items():
+                    entry_tick = bounds_of(inst_id, w_start, entry)[1]
+                    spans[inst_id].extend([(entry_tick, entry_tick), (last, last)])
+
+        for inst_id, spec in indicator_spans:
+            self._ensure_indicator(catalog_path, inst_id, spec)
+        return (
+            {inst_id: merge_windows(inst_spans) for inst_id, inst_spans in spans.items()},
+            {key: merge_windows(ind_spans) for key, ind_spans in indicator_spans.items()},
+        )
+
+    def _run_partitioned(self, root: Path, strategy_configs: list[dict], start_date: str, end_date: str):
+        # BacktestNode needs one data config per partition catalog and re-sorts everything loaded so far
+        # on each one, quadratic in the number of instrument-months. Loading the pruned partitions straight
+        # into the engine unsorted and sorting once keeps it at a single sort
+        spans, indicator_spans = self.demanded_spans(root, strategy_configs, start_date, end_date)
+        partitioned = PartitionedCatalog(root)
+
+        engine = BacktestEngine()
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.CASH,
+            base_currency=USD,
+            starting_balances=[Money.from_str(self.venue_bal)],
+        )
+        for sim in self.sims:
+            engine.add_instrument(sim)
+        streams = []
+        for inst_id, inst_spans in spans.items():
+            ticks = [tick for span_start, span_end in inst_spans for tick in partitioned.trade_ticks(inst_id, span_start, span_end)]
+            streams.append((ticks, None))
+        for (inst_id, spec), ind_spans in indicator_spans.items():
+            values = [v for span_start, span_end in ind_spans for v in load_indicator(root, spec, inst_id, span_start, span_end)]
+            streams.append((values, PRECOMPUTED_CLIENT_ID))
+        streams = [(data, client_id) for data, client_id in streams if data]
+        # only the last add sorts the whole stream by ts_init, engine.sort_data() sorts without a key
+        for i, (data, client_id) in enumerate(streams):
+            engine.add_data(data, client_id=client_id, sort=i == len(streams) - 1)
+
+        for cfg in strategy_configs:
+            engine.add_strategy(StrategyFactory.create(ImportableStrategyConfig(**cfg)))
+        engine.run()
+        result = engine.get_result()
+        engine.dispose()
+        return result
+
+
+_log_guard = None
+
+
+def _init_logging_once() -> None:
+    # a second init_logging in the same process is a Rust panic Python cannot catch
+    global _log_guard
+    if _log_guard is None:
+        _log_guard = init_logging()
+
+
+def _to_nanos(date: str) -> int:
+    return dt_to_unix_nanos(pd.Timestamp(date, tz="America/New_York"))
+
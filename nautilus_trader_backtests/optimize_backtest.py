@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from bt_engine_classes.optimizer import HyperbandOptimizer
+from bt_engine_classes.yfinancebt import YFinanceBT
+
+SYMBOLS             =   ["AAPL"]
+START_DATE          =   f"2024-07-02"
+END_DATE            =   f"2024-12-31"
+INTERVAL            =   "1h"
+DATA_OUTPUT_PATH    =   "/Users/evankolberg/Library/CloudStorage/OneDrive-Personal/Desktop/macOS_programming/quant_dev_first_repo/Data"
+VENUE_BAL           =   "1_000_000 USD"
+TRIALS_DB           =   "momentum_trials.sqlite"
+
+sims                =   [TestInstrumentProvider.equity(symbol=s, venue="SIM") for s in SYMBOLS]
+
+STRATEGY_CONFIG     =   {
+                            "strategy_path": "strategies.momentum:Momentum",
+                            "config_path": "strategies.momentum:MomentumConfig",
+                            "config": {
+                                "instrument_id": sims[0].id,
+                            },
+                        }
+
+SEARCH_SPACE        =   {
+                            "window": [2, 3, 5, 8, 10, 15, 20, 30, 50],
+                            "trade_size": [Decimal(100_000), Decimal(200_000), Decimal(400_000)],
+                        }
+
+# the guard matters: trials run in spawned processes which re-import this module
+if __name__ == "__main__":
+
+    bt = YFinanceBT(
+        SYMBOLS, START_DATE, END_DATE,
+        INTERVAL, DATA_OUTPUT_PATH,
+        VENUE_BAL, sims, [STRATEGY_CONFIG],
+    )
+
+    hyperband = HyperbandOptimizer(bt, STRATEGY_CONFIG, SEARCH_SPACE, trials_db=TRIALS_DB)
+    best = hyperband.hyperband()
+    print(f"Hyperband best: {best.params} score={best.score:.2f} engine-seconds={hyperband.engine_seconds:.1f}")
+
+    grid = HyperbandOptimizer(bt, STRATEGY_CONFIG, SEARCH_SPACE)
+    best = grid.grid()
+    print(f"Grid best:      {best.params} score={best.score:.2f} engine-seconds={grid.engine_seconds:.1f}")
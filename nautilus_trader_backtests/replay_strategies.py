@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from bt_engine_classes.replay import ReplayHarness
+from bt_engine_classes.yfinancebt import YFinanceBT
+
+SYMBOLS             =   ["AAPL", "MSFT", "GOOG", "AMZN", "TSLA"]
+START_DATE          =   f"2024-07-02"
+END_DATE            =   f"2024-12-31"
+INTERVAL            =   "1h"
+DATA_OUTPUT_PATH    =   "/Users/evankolberg/Library/CloudStorage/OneDrive-Personal/Desktop/macOS_programming/quant_dev_first_repo/Data"
+VENUE_BAL           =   "1_000_000 USD"
+SPEEDS              =   [36_000.0, None] # 1h bars -> ten bars per second, then max speed
+
+sims                =   [TestInstrumentProvider.equity(symbol=s, venue="SIM") for s in SYMBOLS]
+
+STRATEGY_CONFIGS    =   [
+                            {
+                                "strategy_path": "strategies.momentum:Momentum",
+                                "config_path": "strategies.momentum:MomentumConfig",
+                                "config": {"instrument_id": sims[0].id, "trade_size": Decimal(100_000), "window": 10},
+                            },
+                            {
+                                "strategy_path": "strategies.concavity:Concavity",
+                                "config_path": "strategies.concavity:ConcavityConfig",
+                                "config": {"instrument_id": sims[0].id, "trade_size": Decimal(100_000), "window": 10},
+                            },
+                            {
+                                "strategy_path": "strategies.multi_buy_n_hold:MultiBuyAndHold",
+                                "config_path": "strategies.multi_buy_n_hold:MultiBuyAndHoldConfig",
+                                "config": {
+                                    "instrument_ids": [sim.id for sim in sims],
+                                    "trade_size": Decimal(200_000),
+                                    "multipliers": [1 / len(SYMBOLS) for _ in SYMBOLS],
+                                },
+                            },
+                        ]
+
+catalog_path        =   YFinanceBT(
+                            SYMBOLS, START_DATE, END_DATE,
+                            INTERVAL, DATA_OUTPUT_PATH,
+                            VENUE_BAL, sims, STRATEGY_CONFIGS
+                        ).ingest()
+
+for speed in SPEEDS:
+    harness = ReplayHarness(catalog_path, [sim.id for sim in sims], VENUE_BAL, speed=speed)
+    for report in harness.run(STRATEGY_CONFIGS):
+        print(report)
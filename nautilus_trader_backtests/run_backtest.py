@@ -16,6 +16,7 @@ END_DATE            =   f"2024-12-31"
 INTERVAL            =   "1h"
 DATA_OUTPUT_PATH    =   "/Users/evankolberg/Library/CloudStorage/OneDrive-Personal/Desktop/macOS_programming/quant_dev_first_repo/Data"
 VENUE_BAL           =   "1_000_000 USD"
+STORAGE_PROFILE     =   "fast-scan" # see bt_engine_classes/misc_util/storage.py
 
 sims                =   [TestInstrumentProvider.equity(symbol=s, venue="SIM") for s in SYMBOLS]
 
@@ -34,7 +35,8 @@ STRATEGY_CONFIGS    =   [
 RESULTS             =   YFinanceBT(
                             SYMBOLS, START_DATE, END_DATE,
                             INTERVAL, DATA_OUTPUT_PATH,
-                            VENUE_BAL, sims, STRATEGY_CONFIGS
+                            VENUE_BAL, sims, STRATEGY_CONFIGS,
+                            storage_profile=STORAGE_PROFILE,
                         ).run_backtest()
 
 print(RESULTS)
@@ -11,6 +11,8 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.trading.strategy import Strategy
 
+from bt_engine_classes.data_demand import DataDemand
+
 
 class BuyAndHoldConfig(StrategyConfig):
     instrument_id: InstrumentId
@@ -32,6 +34,10 @@ class BuyAndHold(Strategy):
         self.initial_price = None
         self.position = None
 
+    @classmethod
+    def data_demand(cls, config: BuyAndHoldConfig) -> DataDemand:
+        return DataDemand(instrument_ids=(config.instrument_id,), first_and_last=True)
+
     def on_start(self):
         self.subscribe_trade_ticks(self.instrument_id)
         self.log.info("Strategy started", color=LogColor.GREEN)
@@ -53,6 +59,7 @@ class BuyAndHold(Strategy):
                 quantity=quantity,
             )
             self.submit_order(order)
+            self.unsubscribe_trade_ticks(self.instrument_id)
 
     def on_event(self, event):
         if isinstance(event, (PositionOpened, PositionChanged)):
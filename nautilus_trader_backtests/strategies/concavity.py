@@ -3,7 +3,8 @@ from decimal import Decimal
 
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.config import StrategyConfig
-from nautilus_trader.model.data import TradeTick
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import DataType, TradeTick
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.events.position import (PositionChanged,
                                                    PositionClosed,
@@ -12,17 +13,22 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.trading.strategy import Strategy
 
+from bt_engine_classes.data_demand import DataDemand
+from bt_engine_classes.indicators import PRECOMPUTED_CLIENT_ID, IndicatorSpec, IndicatorValue
+
 
 class ConcavityConfig(StrategyConfig):
     instrument_id: InstrumentId
     trade_size: Decimal
     window: int
+    use_precomputed: bool = False
 
 
 class Concavity(Strategy):
     """
     A simple concavity-based strategy:
     Buys when price concave up, closes when concave down
+    With use_precomputed the second difference comes from the precomputed catalog stream
     """
     def __init__(self, config: ConcavityConfig):
         super().__init__(config)
@@ -31,28 +37,54 @@ class Concavity(Strategy):
         self.window = config.window
         self.prices = deque(maxlen=self.window)
         self.position = None
+        self.signal = self.signal_spec(config)
+        self.last_price = None
+
+    @staticmethod
+    def signal_spec(config: ConcavityConfig) -> IndicatorSpec:
+        if config.use_precomputed and config.window < 3:
+            raise ValueError("use_precomputed needs window >= 3, smaller windows never trade")
+        return IndicatorSpec.of("second_diff", window=config.window)
+
+    @classmethod
+    def data_demand(cls, config: ConcavityConfig) -> DataDemand:
+        indicators = (cls.signal_spec(config),) if config.use_precomputed else ()
+        return DataDemand(instrument_ids=(config.instrument_id,), indicators=indicators)
 
     def on_start(self):
         self.subscribe_trade_ticks(self.instrument_id)
+        if self.config.use_precomputed:
+            self.subscribe_data(DataType(IndicatorValue), client_id=PRECOMPUTED_CLIENT_ID)
         self.log.info("Concavity strategy started", color=LogColor.GREEN)
 
     def on_trade_tick(self, trade_tick: TradeTick):
         price = trade_tick.price
+        if self.config.use_precomputed:
+            self.last_price = price
+            return
         self.prices.append(price)
         if len(self.prices) == self.window:
             # compute second difference
             first_diff = [self.prices[i+1] - self.prices[i] for i in range(self.window-1)]
             second_diff = first_diff[-1] - first_diff[-2] if len(first_diff) >=2 else 0
-            if second_diff > 0 and not self.position:
-                quantity = Quantity.from_int(max(1, int(self.trade_size // price)))
-                order = self.order_factory.market(
-                    instrument_id=self.instrument_id,
-                    order_side=OrderSide.BUY,
-                    quantity=quantity,
-                )
-                self.submit_order(order)
-            elif second_diff < 0 and self.position:
-                self.close_position(self.position)
+            self.on_signal(price, second_diff)
+
+    def on_data(self, data: Data):
+        second_diff = self.signal.value_of(data, self.instrument_id)
+        if second_diff is not None and self.last_price is not None:
+            self.on_signal(self.last_price, second_diff)
+
+    def on_signal(self, price, second_diff):
+        if second_diff > 0 and not self.position:
+            quantity = Quantity.from_int(max(1, int(self.trade_size // price)))
+            order = self.order_factory.market(
+                instrument_id=self.instrument_id,
+                order_side=OrderSide.BUY,
+                quantity=quantity,
+            )
+            self.submit_order(order)
+        elif second_diff < 0 and self.position:
+            self.close_position(self.position)
 
     def on_event(self, event):
         if isinstance(event, PositionOpened):
@@ -3,7 +3,8 @@ from decimal import Decimal
 
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.config import StrategyConfig
-from nautilus_trader.model.data import TradeTick
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import DataType, TradeTick
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.events.position import (PositionClosed,
                                                    PositionOpened)
@@ -11,16 +12,22 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.trading.strategy import Strategy
 
+from bt_engine_classes.data_demand import DataDemand
+from bt_engine_classes.indicators import PRECOMPUTED_CLIENT_ID, IndicatorSpec, IndicatorValue
+
 
 class MomentumConfig(StrategyConfig):
     instrument_id: InstrumentId
     trade_size: Decimal
     window: int
+    use_precomputed: bool = False
 
 
 class Momentum(Strategy):
     """
     Buys if current price exceeds price N ticks ago; closes when it falls below.
+    With use_precomputed the N-tick change comes from the precomputed catalog stream
+    instead of being recomputed tick by tick.
     """
     def __init__(self, config: MomentumConfig):
         super().__init__(config)
@@ -29,26 +36,51 @@ class Momentum(Strategy):
         self.window = config.window
         self.prices = deque(maxlen=self.window)
         self.position = None
+        self.signal = self.signal_spec(config)
+        self.last_price = None
+
+    @staticmethod
+    def signal_spec(config: MomentumConfig) -> IndicatorSpec:
+        # prices[0] of a full window is window - 1 ticks old
+        return IndicatorSpec.of("change", n=config.window - 1)
+
+    @classmethod
+    def data_demand(cls, config: MomentumConfig) -> DataDemand:
+        indicators = (cls.signal_spec(config),) if config.use_precomputed else ()
+        return DataDemand(instrument_ids=(config.instrument_id,), indicators=indicators)
 
     def on_start(self):
         self.subscribe_trade_ticks(self.instrument_id)
+        if self.config.use_precomputed:
+            self.subscribe_data(DataType(IndicatorValue), client_id=PRECOMPUTED_CLIENT_ID)
         self.log.info("Momentum strategy started", color=LogColor.GREEN)
 
     def on_trade_tick(self, trade_tick: TradeTick):
         price = trade_tick.price
+        if self.config.use_precomputed:
+            self.last_price = price
+            return
         self.prices.append(price)
         if len(self.prices) == self.window:
             prev_price = self.prices[0]
-            if price > prev_price and not self.position:
-                qty = Quantity.from_int(max(1, int(self.trade_size // price)))
-                order = self.order_factory.market(
-                    instrument_id=self.instrument_id,
-                    order_side=OrderSide.BUY,
-                    quantity=qty,
-                )
-                self.submit_order(order)
-            elif price < prev_price and self.position:
-                self.close_position(self.position)
+            self.on_signal(price, price - prev_price)
+
+    def on_data(self, data: Data):
+        change = self.signal.value_of(data, self.instrument_id)
+        if change is not None and self.last_price is not None:
+            self.on_signal(self.last_price, change)
+
+    def on_signal(self, price, signal):
+        if signal > 0 and not self.position:
+            qty = Quantity.from_int(max(1, int(self.trade_size // price)))
+            order = self.order_factory.market(
+                instrument_id=self.instrument_id,
+                order_side=OrderSide.BUY,
+                quantity=qty,
+            )
+            self.submit_order(order)
+        elif signal < 0 and self.position:
+            self.close_position(self.position)
 
     def on_event(self, event):
         if isinstance(event, PositionOpened):
@@ -11,6 +11,8 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.trading.strategy import Strategy
 
+from bt_engine_classes.data_demand import DataDemand
+
 
 class MultiBuyAndHoldConfig(StrategyConfig):
     instrument_ids: List[InstrumentId]
@@ -26,6 +28,11 @@ class MultiBuyAndHold(Strategy):
         self._ordered = False
         self._positions: List = []
 
+    @classmethod
+    def data_demand(cls, config: MultiBuyAndHoldConfig) -> DataDemand:
+        # entry prices on the first ticks, the final mark on the last ones
+        return DataDemand(instrument_ids=tuple(config.instrument_ids), first_and_last=True)
+
     def on_start(self):
         for inst in self.config.instrument_ids:
             self.subscribe_trade_ticks(inst)
@@ -47,6 +54,8 @@ class MultiBuyAndHold(Strategy):
             )
             self.submit_order(order)
         self._ordered = True
+        for inst in self.config.instrument_ids:
+            self.unsubscribe_trade_ticks(inst)
 
     def on_event(self, event):
         if isinstance(event, PositionOpened):
@@ -0,0 +1,124 @@
+from decimal import Decimal
+from typing import List, Optional
+
+import numpy as np
+from nautilus_trader.common.enums import LogColor
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events.position import (PositionChanged,
+                                                   PositionClosed,
+                                                   PositionOpened)
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.trading.strategy import Strategy
+
+from bt_engine_classes.data_demand import DataDemand
+from bt_engine_classes.misc_util.covariance import WEIGHTINGS, RollingCovariance
+
+# weightings that invert the covariance, meaningless while it is singular
+FULL_RANK_WEIGHTINGS = ("risk_parity", "min_variance")
+
+
+class RiskWeightedConfig(StrategyConfig):
+    instrument_ids: List[InstrumentId]
+    trade_size: Decimal
+    weighting: str = "inverse_vol"      # inverse_vol, risk_parity or min_variance
+    lookback: Optional[int] = 60        # rolling window of returns, in timestamps
+    halflife: Optional[float] = None    # exponentially weighted instead of rolling when set
+    rebalance_every: int = 20           # timestamps between rebalances
+    min_history: int = 20               # returns needed before the first rebalance, at least N + 1 for
+                                        # risk_parity and min_variance so the covariance is full rank
+
+
+class RiskWeighted(Strategy):
+    """
+    Multi-instrument portfolio rebalanced to inverse-volatility, risk-parity or min-variance weights
+    The covariance of log returns is updated once per timestamp with rank-one updates
+    Missing ticks at a timestamp are forward filled from the last known price
+    Trade size is the total investment split across instruments by weight
+    risk_parity and min_variance need a full-rank covariance, i.e. more returns than instruments
+    """
+    def __init__(self, config: RiskWeightedConfig):
+        super().__init__(config)
+        if config.weighting not in WEIGHTINGS:
+            raise ValueError(f"Unknown weighting '{config.weighting}'. Expected one of {sorted(WEIGHTINGS)}")
+        n = len(config.instrument_ids)
+        full_rank = config.weighting in FULL_RANK_WEIGHTINGS
+        if full_rank and not config.halflife and config.lookback <= n:
+            raise ValueError(
+                f"{config.weighting} needs lookback > number of instruments ({n}), "
+                f"a shorter window gives a singular covariance"
+            )
+        self._min_history = max(config.min_history, n + 1) if full_rank else config.min_history
+        self._index = {inst: i for i, inst in enumerate(config.instrument_ids)}
+        self._weigh = WEIGHTINGS[config.weighting]
+        self._cov = RollingCovariance(
+            len(config.instrument_ids),
+            window=None if config.halflife else config.lookback,
+            halflife=config.halflife,
+        )
+        self._prices = np.full(len(config.instrument_ids), np.nan)
+        self._prev_prices = None
+        self._ts = None
+        self._since_rebalance = 0
+        self._positions = {}
+
+    @classmethod
+    def data_demand(cls, config: RiskWeightedConfig) -> DataDemand:
+        return DataDemand(instrument_ids=tuple(config.instrument_ids))
+
+    def on_start(self):
+        for inst in self.config.instrument_ids:
+            self.subscribe_trade_ticks(inst)
+        self.log.info(f"RiskWeighted ({self.config.weighting}) started", color=LogColor.GREEN)
+
+    def on_trade_tick(self, trade_tick: TradeTick):
+        if self._ts is not None and trade_tick.ts_event > self._ts:
+            self._close_timestamp()
+        self._ts = trade_tick.ts_event
+        self._prices[self._index[trade_tick.instrument_id]] = float(trade_tick.price)
+
+    def _close_timestamp(self):
+        if np.isnan(self._prices).any():
+            return
+        if self._prev_prices is not None:
+            self._cov.update(np.log(self._prices / self._prev_prices))
+        self._prev_prices = self._prices.copy()
+
+        self._since_rebalance += 1
+        if self._cov.count >= self._min_history and self._since_rebalance >= self.config.rebalance_every:
+            self._rebalance(self._weigh(self._cov.cov))
+            self._since_rebalance = 0
+
+    def _rebalance(self, weights: np.ndarray):
+        for inst_id, weight, price in zip(self.config.instrument_ids, weights, self._prices):
+            target = int(float(self.config.trade_size) * weight // price)
+            position = self._positions.get(inst_id)
+            held = int(position.quantity) if position else 0
+            delta = target - held
+            if delta == 0 or (delta < 0 and not position):
+                continue
+            order = self.order_factory.market(
+                instrument_id=inst_id,
+                order_side=OrderSide.BUY if delta > 0 else OrderSide.SELL,
+                quantity=Quantity.from_int(abs(delta)),
+                reduce_only=delta < 0,
+            )
+            # HEDGING oms: route into the open position instead of opening a new one
+            self.submit_order(order, position_id=position.id if position else None)
+
+    def on_event(self, event):
+        if isinstance(event, (PositionOpened, PositionChanged)):
+            self._positions[event.instrument_id] = self.cache.position(event.position_id)
+        elif isinstance(event, PositionClosed):
+            self._positions.pop(event.instrument_id, None)
+
+    def on_stop(self):
+        for pos in list(self._positions.values()):
+            self.close_position(pos)
+        self.log.info("RiskWeighted stopped", color=LogColor.GREEN)
+
+
+if __name__ == "__main__":
+    print('\033[1;31mDo not run this file directly\033[0m')